@@ -20,6 +20,8 @@ class BaseRenderer(ABC):
 
     def update_weather(self):
         """Get weather updates"""
+        if self.weather_service is None:
+            return
         self.weather_data = self.weather_service.get_weather("Moscow")
         if self.weather_data:
             print(f"Temperature: {self.weather_data['temperature']['celsius']}°C")
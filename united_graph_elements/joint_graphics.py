@@ -1,10 +1,31 @@
+import argparse
+import threading
+
+from weather_service.startup_timer import StartupTimer
+
+# Created before the heavy imports below so their cost is part of the report
+startup = StartupTimer()
+
 import pygame
-from pygame.locals import *
-from OpenGL.GL import *
-from OpenGL.GLU import *
+from pygame.locals import (
+    DOUBLEBUF, OPENGL, MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION, MOUSEWHEEL
+)
+from OpenGL.GL import (
+    glBegin, glClear, glColor3f, glColorMaterial, glDisable, glDrawPixels, glEnable, glEnd,
+    glLightfv, glLoadIdentity, glMaterialf, glMaterialfv, glMatrixMode, glNormal3f, glOrtho,
+    glPopAttrib, glPopMatrix, glPushAttrib, glPushMatrix, glRasterPos2f, glRotatef, glScalef,
+    glTranslatef, glVertex2f, glVertex3f, glViewport,
+    GL_ALL_ATTRIB_BITS, GL_AMBIENT, GL_AMBIENT_AND_DIFFUSE, GL_COLOR_BUFFER_BIT,
+    GL_COLOR_MATERIAL, GL_DEPTH_BUFFER_BIT, GL_DEPTH_TEST, GL_DIFFUSE, GL_FRONT,
+    GL_FRONT_AND_BACK, GL_LIGHT0, GL_LIGHTING, GL_MODELVIEW, GL_POSITION, GL_PROJECTION,
+    GL_QUADS, GL_RGBA, GL_SHININESS, GL_SPECULAR, GL_TEXTURE_2D, GL_UNSIGNED_BYTE
+)
+from OpenGL.GLU import gluPerspective
 from base_renderer import BaseRenderer
-from weather_service.weather_service import WeatherService
 
+REQUEST_TIMEOUT_SEC = 10
+
+startup.mark("import pygame and OpenGL")
 
 
 class OpenGLRenderer(BaseRenderer):
@@ -23,9 +44,13 @@ class OpenGLRenderer(BaseRenderer):
         self.button_margin_left = 10
         self.button_margin_bottom = 10
         self.update_reset_button_position()
+        self.button_font = None
+        print("Renderer initialized")
+
+    def load_fonts(self):
+        """SysFont scans the system font list, so it runs after the first frame."""
         pygame.font.init()
         self.button_font = pygame.font.SysFont('Arial', 20)
-        print("Renderer initialized")
 
     def update_reset_button_position(self):
         self.reset_button_x = self.button_margin_left
@@ -162,14 +187,15 @@ class OpenGLRenderer(BaseRenderer):
             glVertex2f(self.reset_button_x, self.reset_button_y + self.reset_button_height)
             glEnd()
 
-            text_surface = self.button_font.render("Reset", True, (255, 255, 255), (51, 51, 51))
-            text_data = pygame.image.tostring(text_surface, "RGBA", True)
-            text_w, text_h = text_surface.get_width(), text_surface.get_height()
+            if self.button_font:
+                text_surface = self.button_font.render("Reset", True, (255, 255, 255), (51, 51, 51))
+                text_data = pygame.image.tostring(text_surface, "RGBA", True)
+                text_w, text_h = text_surface.get_width(), text_surface.get_height()
 
-            text_x = int(self.reset_button_x + (self.reset_button_width - text_w) / 2)
-            text_y = int(self.reset_button_y + (self.reset_button_height - text_h) / 2 + text_h)
-            glRasterPos2f(text_x, text_y)
-            glDrawPixels(text_w, text_h, GL_RGBA, GL_UNSIGNED_BYTE, text_data)
+                text_x = int(self.reset_button_x + (self.reset_button_width - text_w) / 2)
+                text_y = int(self.reset_button_y + (self.reset_button_height - text_h) / 2 + text_h)
+                glRasterPos2f(text_x, text_y)
+                glDrawPixels(text_w, text_h, GL_RGBA, GL_UNSIGNED_BYTE, text_data)
 
             glMatrixMode(GL_PROJECTION)
             glPopMatrix()
@@ -219,18 +245,51 @@ class OpenGLRenderer(BaseRenderer):
             self.scale = max(0.1, min(5.0, self.scale))
 
 
+def load_weather_service(renderer, startup_done):
+    """Imports requests and fetches the weather off the render loop.
+
+    Startup ends once the service exists, so the network fetch is not part of
+    the report, matching main_weather_service.py.
+    """
+    try:
+        from weather_service.weather_service import WeatherService
+        startup.mark("import weather_service")
+        renderer.weather_service = WeatherService(timeout=REQUEST_TIMEOUT_SEC)
+        startup.mark("weather service started")
+    except Exception as e:
+        print(f"Error loading weather service: {e}")
+        return
+    finally:
+        startup_done.set()
+    renderer.update_weather()
+
+
 def main():
     global renderer
 
+    parser = argparse.ArgumentParser(description="Cube")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print import and startup timings once startup completes")
+    parser.add_argument("--quit-after-startup", action="store_true",
+                        help="exit as soon as startup completes (implies --startup-report)")
+    args = parser.parse_args()
+    startup.enabled = args.startup_report or args.quit_after_startup
+
     print("Starting application...")
 
     pygame.init()
     display = (800, 600)
     pygame.display.set_mode(display, DOUBLEBUF | OPENGL)
     pygame.display.set_caption("Cube")
+    startup.mark("window created")
 
-    renderer = OpenGLRenderer(WeatherService())
+    renderer = OpenGLRenderer()
     renderer.init_gl()
+    startup.mark("OpenGL initialized")
+
+    startup_done = threading.Event()
+    first_frame = True
+    reported = False
 
     try:
         while True:
@@ -242,6 +301,19 @@ def main():
 
             renderer.draw()
             pygame.display.flip()
+
+            if first_frame:
+                first_frame = False
+                startup.mark("first frame")
+                renderer.load_fonts()
+                startup.mark("fonts loaded")
+                threading.Thread(target=load_weather_service, args=(renderer, startup_done), daemon=True).start()
+            elif not reported and startup_done.is_set():
+                reported = True
+                startup.report()
+                if args.quit_after_startup:
+                    return
+
             pygame.time.wait(10)
 
     except Exception as e:
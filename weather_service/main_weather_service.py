@@ -1,26 +1,70 @@
+import argparse
 import sys
 import traceback
 
-from weather_service import WeatherService
-from weather_gui import WeatherGUI
-from PySide6.QtWidgets import QApplication
+from startup_timer import StartupTimer
+
+REQUEST_TIMEOUT_SEC = 10
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Weather App")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print import and startup timings once the window is painted")
+    parser.add_argument("--quit-after-startup", action="store_true",
+                        help="exit as soon as startup completes (implies --startup-report)")
+    return parser.parse_known_args()
 
 
 def main():
+    args, qt_args = parse_args()
+    startup = StartupTimer(enabled=args.startup_report or args.quit_after_startup)
+    weather_service = None
+
     print("[MAIN] Launch the application...")
     try:
-        print("[MAIN] Initializing weather service...")
-        weather_service = WeatherService()
-        print("[MAIN] Weather service has been successfully initialized")
-
         print("[MAIN] Creating QApplication...")
-        app = QApplication(sys.argv)
+        # Heavy modules are imported here rather than at module level so that
+        # their cost shows up in the startup report.
+        from PySide6.QtWidgets import QApplication
+        startup.mark("import PySide6.QtWidgets")
+        app = QApplication([sys.argv[0]] + qt_args)
+        startup.mark("QApplication created")
 
         print("[MAIN] Creating GUI...")
-        gui = WeatherGUI(weather_service)
+        from weather_gui import WeatherGUI
+        startup.mark("import weather_gui")
+        gui = WeatherGUI()
         gui.show()
+        startup.mark("GUI shown")
         print("[MAIN] GUI has been successfully created")
 
+        def finish_startup():
+            # Network setup (requests, HTTP session, worker thread) waits
+            # until the window has been painted once.
+            nonlocal weather_service
+            startup.mark("first paint")
+            try:
+                print("[MAIN] Initializing weather service...")
+                from weather_service import WeatherService
+                startup.mark("import weather_service")
+                # The timeout also bounds how long closing the window waits for the worker
+                weather_service = WeatherService(timeout=REQUEST_TIMEOUT_SEC)
+                # A startup measurement run must not depend on the network
+                gui.start(weather_service, start_worker=not args.quit_after_startup)
+                startup.mark("weather service started")
+                print("[MAIN] Weather service has been successfully initialized")
+            except Exception as e:
+                # Runs inside a Qt slot, so main()'s handler would never see it
+                print(f"[ERROR] Failed to initialize weather service: {str(e)}")
+                print(f"[ERROR] Tracing: {traceback.format_exc()}")
+                gui.error_label.setText(f"Error: {e}")
+            startup.report()
+            if args.quit_after_startup:
+                app.quit()
+
+        gui.first_painted.connect(finish_startup)
+
         print("[MAIN] Launch GUI main loop...")
         app.exec()
         print("[MAIN] GUI main loop has been completed")
@@ -33,7 +77,7 @@ def main():
         if 'gui' in locals():
             print("[MAIN] Closing GUI...")
             gui.close()
-        if 'weather_service' in locals():
+        if weather_service is not None:
             print("[MAIN] Closing weather service...")
             weather_service.close()
         print("[MAIN] Clean up procedure has been completed successfully")
@@ -0,0 +1,31 @@
+import sys
+import time
+
+
+class StartupTimer:
+    """Collects startup milestones so time-to-first-window can be measured.
+
+    Marks are always recorded, so the timer can be created before command line
+    flags are parsed; only report() depends on enabled.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        self.marks = []
+
+    def mark(self, label: str):
+        """Records a milestone, measured from timer creation."""
+        self.marks.append((label, time.perf_counter()))
+
+    def report(self, stream=sys.stderr):
+        """Prints every milestone with its own duration and the running total."""
+        if not self.enabled:
+            return
+        print("[STARTUP] Startup report (ms):", file=stream)
+        previous = self.started
+        for label, moment in self.marks:
+            step = (moment - previous) * 1000
+            total = (moment - self.started) * 1000
+            print(f"[STARTUP] {label:<28} +{step:8.1f}  total {total:8.1f}", file=stream)
+            previous = moment
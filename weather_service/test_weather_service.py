@@ -0,0 +1,89 @@
+import csv
+import io
+import threading
+import time
+
+from weather_service import CSV_FIELDS, bulk_export, flatten, read_cities
+
+
+class StubWeatherService:
+    """Counts concurrent fetches and fails for cities starting with 'Bad'."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def fetch_weather(self, city):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(0.002)
+            if city.startswith("Bad"):
+                raise AttributeError("'list' object has no attribute 'get'")
+            return {'temperature': {'celsius': '5', 'fahrenheit': '41'}, 'location': {'city': city}}
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def test_read_cities_skips_blank_lines_and_comments():
+    stream = io.StringIO("Kyiv\n\n# comment\n  Lviv  \n")
+    assert list(read_cities(stream)) == ["Kyiv", "Lviv"]
+
+
+def test_flatten_uses_dotted_keys():
+    assert flatten({'a': {'b': 1, 'c': {'d': 2}}, 'e': 3}) == {'a.b': 1, 'a.c.d': 2, 'e': 3}
+
+
+def test_bulk_export_bounds_requests_in_flight():
+    workers = 4
+    service = StubWeatherService()
+    consumed = 0
+
+    def cities():
+        nonlocal consumed
+        for i in range(200):
+            consumed += 1
+            yield f"City{i}"
+
+    written = 0
+
+    class Out(io.StringIO):
+        def write(self, text):
+            nonlocal written
+            written += 1
+            # Input is read lazily: never more than 2 * workers records ahead of output
+            assert consumed - written <= workers * 2
+            return super().write(text)
+
+    summary = bulk_export(service, cities(), Out(), "ndjson", workers)
+
+    assert summary['total'] == 200
+    assert service.max_running <= workers
+
+
+def test_bulk_export_isolates_failed_city():
+    out = io.StringIO()
+    summary = bulk_export(StubWeatherService(), iter(["Kyiv", "BadTown", "Lviv"]), out, "ndjson", 2)
+
+    assert summary['total'] == 3
+    assert summary['ok'] == 2
+    assert [city for city, _, _ in summary['failed']] == ["BadTown"]
+    assert summary['failed'][0][2].startswith("AttributeError")
+    assert len(out.getvalue().splitlines()) == 3
+
+
+def test_bulk_export_csv_columns():
+    out = io.StringIO()
+    bulk_export(StubWeatherService(), iter(["Kyiv"]), out, "csv", 1)
+
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows[0] == CSV_FIELDS
+    row = dict(zip(rows[0], rows[1]))
+    assert row['city'] == "Kyiv"
+    assert row['ok'] == "True"
+    assert row['location.city'] == "Kyiv"
+    assert row['temperature.celsius'] == "5"
+    assert row['error'] == ""
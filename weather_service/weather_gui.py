@@ -56,18 +56,18 @@ class WeatherUpdateWorker(QObject):
 
 
 class WeatherGUI(QMainWindow):
-    def __init__(self, weather_service):
+    first_painted = Signal()
+
+    def __init__(self, weather_service=None):
         super().__init__()
         self.weather_service = weather_service
         self.city = "Poltava"
         self.setWindowTitle("Weather App")
         self.setFixedSize(400, 500)
 
-        title_font = QFont("Arial", 16, QFont.Bold)
         value_font = QFont("Arial", 14, QFont.Bold)
         label_font = QFont("Arial", 12)
 
-        value_style = "color: #0066cc; font-weight: bold;"
         error_style = "color: #cc0000; font-weight: bold; font-size: 14px;"
 
         main_layout = QVBoxLayout()
@@ -95,6 +95,7 @@ class WeatherGUI(QMainWindow):
         self.update_btn.setFixedHeight(40)
         self.update_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
         self.update_btn.clicked.connect(self.manual_update)
+        self.update_btn.setEnabled(False)
 
         main_layout.addWidget(self.icon_label)
         main_layout.addWidget(self.city_label)
@@ -108,9 +109,31 @@ class WeatherGUI(QMainWindow):
         main_widget.setLayout(main_layout)
         self.setCentralWidget(main_widget)
 
-        self.icons = self.load_icons()
-
+        self.icons = {}
         self.weather_data = None
+        self.worker = None
+        self.thread = None
+        self._first_paint_done = False
+
+        if self.weather_service is not None:
+            self.start(self.weather_service)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._first_paint_done:
+            self._first_paint_done = True
+            # Leave the paint handler before anyone starts heavier setup
+            QTimer.singleShot(0, self.first_painted.emit)
+
+    def start(self, weather_service, start_worker=True):
+        """Loads icons and starts background updates; call after the window is shown.
+
+        With start_worker=False no update thread is started and nothing is fetched.
+        """
+        self.weather_service = weather_service
+        self.icons = self.load_icons()
+        if not start_worker:
+            return
 
         self.worker = WeatherUpdateWorker(self.weather_service, self.city, 300)
         self.thread = QThread()
@@ -121,7 +144,9 @@ class WeatherGUI(QMainWindow):
         self.worker.finished.connect(self.thread.quit)
         self.thread.start()
 
-        self.manual_update()
+        # The worker fetches as soon as it starts, no need for a direct fetch here
+        self.update_btn.setText("Update...")
+        QTimer.singleShot(5000, self.reset_update_button)
 
     def load_icons(self):
         pix = QPixmap(96, 96)
@@ -219,9 +244,10 @@ class WeatherGUI(QMainWindow):
         self.last_update_label.setText(f"Latest update: <b>{datetime.now().strftime('%H:%M:%S')}</b>")
 
     def closeEvent(self, event):
-        self.worker.stop()
-        self.thread.quit()
-        self.thread.wait()
+        if self.worker is not None:
+            self.worker.stop()
+            self.thread.quit()
+            self.thread.wait()
         event.accept()
 
     def reset_update_button(self):
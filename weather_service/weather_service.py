@@ -1,55 +1,41 @@
-import requests
+import argparse
+import csv
 import json
-from typing import Dict, Optional
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from typing import Dict, Iterator, Optional, TextIO
+from urllib.parse import quote
+
+import requests
 
 
 class WeatherService:
-    def __init__(self):
+    def __init__(self, timeout: Optional[float] = None):
         self.base_url = "https://wttr.in"
+        self.timeout = timeout
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session of the calling thread; requests.Session is not thread-safe."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
 
     def get_weather(self, city: str) -> Optional[Dict]:
         """Gets a weather for certain city."""
         try:
-            url = f"{self.base_url}/{city}?format=j1"
-            response = requests.get(url)
-            response.raise_for_status()
-
-            weather_data = response.json()
-
-            current = weather_data.get('current_condition', [{}])[0]
-            weather = weather_data.get('weather', [{}])[0]
-
-            return {
-                'temperature': {
-                    'celsius': current.get('temp_C'),
-                    'fahrenheit': current.get('temp_F')
-                },
-                'feels_like': {
-                    'celsius': current.get('FeelsLikeC'),
-                    'fahrenheit': current.get('FeelsLikeF')
-                },
-                'description': current.get('weatherDesc', [{}])[0].get('value'),
-                'humidity': current.get('humidity'),
-                'wind_speed': {
-                    'kmh': current.get('windspeedKmph'),
-                    'mph': current.get('windspeedMiles')
-                },
-                'pressure': {
-                    'mb': current.get('pressure'),
-                    'inches': current.get('pressureInches')
-                },
-                'visibility': {
-                    'km': current.get('visibility'),
-                    'miles': current.get('visibilityMiles')
-                },
-                'uv_index': current.get('uvIndex'),
-                'location': {
-                    'city': weather_data.get('nearest_area', [{}])[0].get('areaName', [{}])[0].get('value'),
-                    'country': weather_data.get('nearest_area', [{}])[0].get('country', [{}])[0].get('value'),
-                    'region': weather_data.get('nearest_area', [{}])[0].get('region', [{}])[0].get('value')
-                }
-            }
-
+            return self.fetch_weather(city)
         except requests.exceptions.RequestException as e:
             print(f"Error occurred while retrieving weather data: {e}")
             return None
@@ -57,11 +43,53 @@ class WeatherService:
             print(f"Error occurred while processing weather data: {e}")
             return None
 
+    def fetch_weather(self, city: str) -> Dict:
+        """Gets a weather for certain city, raising on any failure."""
+        url = f"{self.base_url}/{quote(city, safe='')}?format=j1"
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+
+        weather_data = response.json()
+
+        current = weather_data.get('current_condition', [{}])[0]
+        weather = weather_data.get('weather', [{}])[0]
+
+        return {
+            'temperature': {
+                'celsius': current.get('temp_C'),
+                'fahrenheit': current.get('temp_F')
+            },
+            'feels_like': {
+                'celsius': current.get('FeelsLikeC'),
+                'fahrenheit': current.get('FeelsLikeF')
+            },
+            'description': current.get('weatherDesc', [{}])[0].get('value'),
+            'humidity': current.get('humidity'),
+            'wind_speed': {
+                'kmh': current.get('windspeedKmph'),
+                'mph': current.get('windspeedMiles')
+            },
+            'pressure': {
+                'mb': current.get('pressure'),
+                'inches': current.get('pressureInches')
+            },
+            'visibility': {
+                'km': current.get('visibility'),
+                'miles': current.get('visibilityMiles')
+            },
+            'uv_index': current.get('uvIndex'),
+            'location': {
+                'city': weather_data.get('nearest_area', [{}])[0].get('areaName', [{}])[0].get('value'),
+                'country': weather_data.get('nearest_area', [{}])[0].get('country', [{}])[0].get('value'),
+                'region': weather_data.get('nearest_area', [{}])[0].get('region', [{}])[0].get('value')
+            }
+        }
+
     def get_weather_text(self, city: str) -> str:
         """Gets the weather in text format."""
         try:
-            url = f"{self.base_url}/{city}"
-            response = requests.get(url)
+            url = f"{self.base_url}/{quote(city, safe='')}"
+            response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
             return response.text
         except requests.exceptions.RequestException as e:
@@ -70,22 +98,179 @@ class WeatherService:
 
     def close(self):
         print("[WeatherService] Closing service...")
-        if hasattr(self, 'session') and self.session:
-            self.session.close()
-            print("[WeatherService] HTTP session closed")
+        closed = self.close_sessions()
+        if closed:
+            print(f"[WeatherService] HTTP sessions closed: {closed}")
         else:
             print("[WeatherService] No session to close")
 
+    def close_sessions(self) -> int:
+        """Closes the sessions of all threads and returns how many were open."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        return len(sessions)
+
+
+CSV_FIELDS = [
+    'city', 'ok', 'latency_ms', 'error',
+    'location.city', 'location.region', 'location.country',
+    'temperature.celsius', 'temperature.fahrenheit',
+    'feels_like.celsius', 'feels_like.fahrenheit',
+    'description', 'humidity',
+    'wind_speed.kmh', 'wind_speed.mph',
+    'pressure.mb', 'pressure.inches',
+    'visibility.km', 'visibility.miles',
+    'uv_index'
+]
+
+
+def read_cities(stream: TextIO) -> Iterator[str]:
+    """Yields city names one per line, skipping blank lines and # comments."""
+    for line in stream:
+        city = line.strip()
+        if city and not city.startswith('#'):
+            yield city
+
+
+def flatten(data: Dict, prefix: str = "") -> Dict:
+    """Flattens nested weather dict into dotted keys for CSV output."""
+    flat = {}
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
 
-if __name__ == "__main__":
-    weather_service = WeatherService()
 
-    weather_data = weather_service.get_weather("Poltava")
-    if weather_data:
-        print("\nWeather data in JSON format:")
-        print(json.dumps(weather_data, indent=2, ensure_ascii=False))
+def fetch_record(weather_service: WeatherService, city: str) -> Dict:
+    """Fetches one city and wraps the result with its status and latency."""
+    started = time.perf_counter()
+    try:
+        data = weather_service.fetch_weather(city)
+        error = None
+    except Exception as e:
+        # One malformed response must not abort a snapshot of thousands of cities
+        data = None
+        error = f"{type(e).__name__}: {e}"
+    latency_ms = round((time.perf_counter() - started) * 1000, 1)
+    return {'city': city, 'ok': error is None, 'latency_ms': latency_ms, 'error': error, 'weather': data}
 
-    weather_text = weather_service.get_weather_text("Poltava")
-    if weather_text:
-        print("\nWeather data in text format:")
-        print(weather_text)
\ No newline at end of file
+
+def bulk_export(weather_service: WeatherService, cities: Iterator[str], out: TextIO,
+                fmt: str = "ndjson", workers: int = 8) -> Dict:
+    """Fetches cities concurrently and streams each record to out as it completes.
+
+    At most 2 * workers requests are queued or running, so memory stays
+    constant no matter how long the city list is. Returns summary statistics.
+    """
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=CSV_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+
+    summary = {'total': 0, 'ok': 0, 'failed': [], 'latency_min': None, 'latency_max': None, 'latency_sum': 0.0}
+
+    def emit(record):
+        if writer:
+            row = {key: value for key, value in record.items() if key != 'weather'}
+            row.update(flatten(record['weather'] or {}))
+            writer.writerow(row)
+        else:
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.flush()
+
+        latency = record['latency_ms']
+        summary['total'] += 1
+        summary['latency_sum'] += latency
+        if summary['latency_min'] is None or latency < summary['latency_min']:
+            summary['latency_min'] = latency
+        if summary['latency_max'] is None or latency > summary['latency_max']:
+            summary['latency_max'] = latency
+        if record['ok']:
+            summary['ok'] += 1
+        else:
+            summary['failed'].append((record['city'], latency, record['error']))
+
+    max_in_flight = workers * 2
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending = set()
+        for city in cities:
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    emit(future.result())
+            pending.add(executor.submit(fetch_record, weather_service, city))
+        for future in wait(pending).done:
+            emit(future.result())
+    except BaseException:
+        # Output failed or the user interrupted: drop queued requests instead
+        # of waiting for all of them to finish
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+    return summary
+
+
+def print_summary(summary: Dict, elapsed: float, stream: TextIO = sys.stderr):
+    total = summary['total']
+    print(f"[BULK] {total} cities in {elapsed:.1f}s: {summary['ok']} ok, {len(summary['failed'])} failed",
+          file=stream)
+    if total:
+        mean = summary['latency_sum'] / total
+        print(f"[BULK] Latency ms: min {summary['latency_min']}, mean {mean:.1f}, max {summary['latency_max']}",
+              file=stream)
+    for city, latency, error in summary['failed']:
+        print(f"[BULK] Failed: {city} ({latency} ms) - {error}", file=stream)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk export of current weather for many cities.")
+    parser.add_argument("cities", nargs="?", default="-",
+                        help="file with one city per line, '-' for stdin (default)")
+    parser.add_argument("-f", "--format", choices=["ndjson", "csv"], default="ndjson",
+                        help="output format (default: ndjson)")
+    parser.add_argument("-o", "--output", default="-", help="output file, '-' for stdout (default)")
+    parser.add_argument("-w", "--workers", type=int, default=8, help="concurrent requests (default: 8)")
+    parser.add_argument("-t", "--timeout", type=float, default=15.0,
+                        help="per-request timeout in seconds (default: 15)")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    weather_service = WeatherService(timeout=args.timeout)
+    started = time.perf_counter()
+    with ExitStack() as stack:
+        stack.callback(weather_service.close_sessions)
+        # stdio is reconfigured to match the files opened below, otherwise
+        # Windows would use the locale codepage and write \r\r\n in CSV
+        if args.cities == "-":
+            sys.stdin.reconfigure(encoding="utf-8")
+            source = sys.stdin
+        else:
+            source = stack.enter_context(open(args.cities, encoding="utf-8"))
+        if args.output == "-":
+            sys.stdout.reconfigure(encoding="utf-8", newline="")
+            out = sys.stdout
+        else:
+            out = stack.enter_context(open(args.output, "w", encoding="utf-8", newline=""))
+        try:
+            summary = bulk_export(weather_service, read_cities(source), out, args.format, args.workers)
+        except BrokenPipeError:
+            # The reader went away (e.g. piped into head); point stdout at devnull
+            # so the interpreter does not fail again flushing it on exit
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            return 1
+
+    print_summary(summary, time.perf_counter() - started)
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())